@@ -1,13 +1,108 @@
 #!/usr/bin/env python3
 
 import os
+import io
+import math
 import time
+import asyncio
+import collections
 import pandas as pd
+from watchfiles import awatch
 from datetime import datetime, timedelta
 import logging
-import subprocess
+
+class RollingWindowStats:
+    """Running RTT statistics over a time-ordered sliding window of pings.
+
+    Sums and sums of squares are updated as rows enter and leave the
+    window, and min/max come from monotonic queues, so each update costs
+    O(1) amortised instead of a pass over the whole window.
+    """
+    def __init__(self):
+        self.rows = collections.deque()  # (timestamp, rtt, success) in arrival order
+        self.clear()
+
+    def clear(self):
+        self.rows.clear()
+        self.successes = 0
+        self.n = 0  # successful pings with a usable RTT
+        self.sum = 0.0
+        self.sumsq = 0.0
+        self._head_seq = 0  # sequence number of rows[0]
+        self._min_queue = collections.deque()  # (seq, rtt), rtt increasing
+        self._max_queue = collections.deque()  # (seq, rtt), rtt decreasing
+
+    def add(self, timestamp, rtt, status):
+        seq = self._head_seq + len(self.rows)
+        rtt = float(rtt)
+        success = status == 'success'
+        self.rows.append((timestamp, rtt, success))
+        if not success:
+            return
+
+        self.successes += 1
+        if math.isnan(rtt):
+            return
+
+        self.n += 1
+        self.sum += rtt
+        self.sumsq += rtt * rtt
+        while self._min_queue and self._min_queue[-1][1] >= rtt:
+            self._min_queue.pop()
+        self._min_queue.append((seq, rtt))
+        while self._max_queue and self._max_queue[-1][1] <= rtt:
+            self._max_queue.pop()
+        self._max_queue.append((seq, rtt))
+
+    def expire(self, cutoff_time):
+        """Drop rows at or before cutoff_time"""
+        while self.rows and self.rows[0][0] <= cutoff_time:
+            _, rtt, success = self.rows.popleft()
+            seq = self._head_seq
+            self._head_seq += 1
+            if not success:
+                continue
+
+            self.successes -= 1
+            if math.isnan(rtt):
+                continue
+
+            self.n -= 1
+            self.sum -= rtt
+            self.sumsq -= rtt * rtt
+            if self._min_queue[0][0] == seq:
+                self._min_queue.popleft()
+            if self._max_queue[0][0] == seq:
+                self._max_queue.popleft()
+
+        if self.n == 0:
+            # Drop accumulated rounding error once the window empties
+            self.sum = self.sumsq = 0.0
+
+    def mean(self):
+        return self.sum / self.n
+
+    def std(self):
+        """Sample standard deviation, matching pandas' ddof=1"""
+        if self.n < 2:
+            return float('nan')
+        variance = (self.sumsq - self.sum * self.sum / self.n) / (self.n - 1)
+        return math.sqrt(max(variance, 0.0))
+
+    def min(self):
+        return self._min_queue[0][1]
+
+    def max(self):
+        return self._max_queue[0][1]
 
 class LatencyAlertMonitor:
+    # (threshold key, stats key, unit, description) for each alerting metric
+    ALERT_RULES = (
+        ('rtt', 'avg', 'ms', 'High latency'),
+        ('jitter', 'jitter', 'ms', 'High jitter'),
+        ('loss_rate', 'loss_rate', '%', 'High packet loss'),
+    )
+
     def __init__(self, log_file="logs/network_latency.log",
                  alert_thresholds={
                      'rtt': 100.0,  # ms
@@ -26,94 +121,142 @@ class LatencyAlertMonitor:
             level=logging.INFO,
             format='%(asctime)s - %(levelname)s - %(message)s'
         )
+        # Keep per-event watcher chatter out of the alert log
+        logging.getLogger('watchfiles').setLevel(logging.WARNING)
         
         # Initialize state
         self.last_alert_time = {}
         self.alert_cooldown = 300  # 5 minutes between repeated alerts
+        self.housekeeping_interval = 5  # seconds between checks while the log is idle
+        self._notifications = set()  # in-flight notification tasks, kept so they are not collected
         
-    def send_notification(self, message):
+        # Incremental tail-read state
+        self._offset = 0  # byte offset of the first unread line
+        self._columns = None  # parsed from the log header
+        self._window = RollingWindowStats()  # rows from the last window_size seconds
+        
+    async def send_notification(self, message):
         """Send desktop notification and log alert"""
         logging.info(message)
         
         # Send desktop notification
         try:
-            # For macOS
-            subprocess.run(['osascript', '-e', f'display notification "{message}" with title "Network Alert"'])
+            # For macOS; escape the message so it stays inside the AppleScript string
+            escaped = message.replace('\\', '\\\\').replace('"', '\\"')
+            proc = await asyncio.create_subprocess_exec(
+                'osascript', '-e', f'display notification "{escaped}" with title "Network Alert"')
+            await proc.wait()
         except Exception as e:
             logging.error(f"Failed to send desktop notification: {e}")
     
-    def check_thresholds(self, stats):
+    async def check_thresholds(self, stats):
         """Check if any metrics exceed their thresholds"""
         current_time = time.time()
         
-        # Check RTT
-        if stats['avg'] > self.alert_thresholds['rtt']:
-            if 'rtt' not in self.last_alert_time or \
-               (current_time - self.last_alert_time['rtt']) > self.alert_cooldown:
-                self.send_notification(
-                    f"High latency detected: {stats['avg']:.2f}ms "
-                    f"(threshold: {self.alert_thresholds['rtt']}ms)")
-                self.last_alert_time['rtt'] = current_time
-        
-        # Check jitter
-        if stats['jitter'] > self.alert_thresholds['jitter']:
-            if 'jitter' not in self.last_alert_time or \
-               (current_time - self.last_alert_time['jitter']) > self.alert_cooldown:
-                self.send_notification(
-                    f"High jitter detected: {stats['jitter']:.2f}ms "
-                    f"(threshold: {self.alert_thresholds['jitter']}ms)")
-                self.last_alert_time['jitter'] = current_time
-        
-        # Check packet loss
-        if stats['loss_rate'] > self.alert_thresholds['loss_rate']:
-            if 'loss_rate' not in self.last_alert_time or \
-               (current_time - self.last_alert_time['loss_rate']) > self.alert_cooldown:
-                self.send_notification(
-                    f"High packet loss detected: {stats['loss_rate']:.2f}% "
-                    f"(threshold: {self.alert_thresholds['loss_rate']}%)")
-                self.last_alert_time['loss_rate'] = current_time
+        for key, stat, unit, description in self.ALERT_RULES:
+            threshold = self.alert_thresholds[key]
+            if not stats[stat] > threshold:  # also skips NaN, e.g. jitter of one ping
+                continue
+            if current_time - self.last_alert_time.get(key, -math.inf) <= self.alert_cooldown:
+                continue
+            
+            self.last_alert_time[key] = current_time
+            # Run the notification in the background so osascript does not
+            # hold up the watcher loop
+            task = asyncio.create_task(self.send_notification(
+                f"{description} detected: {stats[stat]:.2f}{unit} "
+                f"(threshold: {threshold}{unit})"))
+            self._notifications.add(task)
+            task.add_done_callback(self._notifications.discard)
     
-    def calculate_statistics(self, df):
-        """Calculate statistics from the data frame"""
-        if df.empty:
-            return None
-
-        successful_pings = df[df['status'] == 'success']
-        if successful_pings.empty:
+    def calculate_statistics(self):
+        """Calculate statistics from the rolling window"""
+        window = self._window
+        if not window.rows or window.n == 0:
             return None
 
         stats = {
-            'avg': successful_pings['rtt'].mean(),
-            'max': successful_pings['rtt'].max(),
-            'min': successful_pings['rtt'].min(),
-            'jitter': successful_pings['rtt'].std(),
-            'loss_rate': (1 - len(successful_pings) / len(df)) * 100
+            'avg': window.mean(),
+            'max': window.max(),
+            'min': window.min(),
+            'jitter': window.std(),
+            'loss_rate': (1 - window.successes / len(window.rows)) * 100
         }
         return stats
     
-    def monitor(self):
-        """Main monitoring loop"""
+    def read_new_rows(self):
+        """Parse only the lines appended to the log since the last read"""
+        with open(self.log_file, 'rb') as f:
+            if os.fstat(f.fileno()).st_size < self._offset:
+                # Log was truncated or recreated, start over
+                self._offset = 0
+                self._columns = None
+                self._window.clear()
+            
+            f.seek(self._offset)
+            if self._columns is None:
+                header = f.readline()
+                if not header.endswith(b'\n'):
+                    return
+                self._columns = header.decode().strip().split(',')
+            
+            chunk = f.read()
+            # Leave a partially written trailing line for the next read
+            end = chunk.rfind(b'\n') + 1
+            self._offset = f.tell() - len(chunk) + end
+        
+        if end == 0:
+            return
+        
+        df = pd.read_csv(io.BytesIO(chunk[:end]), header=None, names=self._columns)
+        df['timestamp'] = pd.to_datetime(df['timestamp'])
+        for timestamp, rtt, status in zip(df['timestamp'], df['rtt'], df['status']):
+            self._window.add(timestamp, rtt, status)
+    
+    def expire_old_rows(self):
+        """Drop rows older than window_size seconds from the window"""
+        cutoff_time = datetime.now() - timedelta(seconds=self.window_size)
+        self._window.expire(cutoff_time)
+    
+    async def process_log(self):
+        """Read appended rows, expire old ones and check thresholds"""
+        try:
+            # Read only what was appended since the last check
+            if os.path.exists(self.log_file):
+                self.read_new_rows()
+            
+            # Keep data from the last window_size seconds
+            self.expire_old_rows()
+            
+            stats = self.calculate_statistics()
+            if stats:
+                await self.check_thresholds(stats)
+        except Exception as e:
+            logging.error(f"Error in monitoring loop: {e}")
+            await asyncio.sleep(5)  # Wait longer if there's an error
+    
+    async def _housekeeping_loop(self):
+        """Expire stale rows and re-check thresholds while the log is idle"""
         while True:
-            try:
-                # Read the log file
-                if os.path.exists(self.log_file):
-                    df = pd.read_csv(self.log_file)
-                    df['timestamp'] = pd.to_datetime(df['timestamp'])
-                    
-                    # Get data from the last window_size seconds
-                    cutoff_time = datetime.now() - timedelta(seconds=self.window_size)
-                    recent_data = df[df['timestamp'] > cutoff_time]
-                    
-                    if not recent_data.empty:
-                        stats = self.calculate_statistics(recent_data)
-                        if stats:
-                            self.check_thresholds(stats)
-                
-                time.sleep(1)  # Check every second
-                
-            except Exception as e:
-                logging.error(f"Error in monitoring loop: {e}")
-                time.sleep(5)  # Wait longer if there's an error
+            await asyncio.sleep(self.housekeeping_interval)
+            await self.process_log()
+    
+    async def monitor(self):
+        """Main monitoring loop, woken by file change events"""
+        log_path = os.path.abspath(self.log_file)
+        housekeeping = asyncio.create_task(self._housekeeping_loop())
+        try:
+            await self.process_log()
+            
+            # Watch the directory so the log can be created or recreated
+            async for changes in awatch(os.path.dirname(log_path),
+                                        watch_filter=lambda change, path: path == log_path,
+                                        debounce=50, step=10):
+                await self.process_log()
+        finally:
+            housekeeping.cancel()
+            for task in self._notifications:
+                task.cancel()
 
 def main():
     # Create logs directory if it doesn't exist
@@ -121,7 +264,7 @@ def main():
     
     # Initialize and start the monitor
     monitor = LatencyAlertMonitor()
-    monitor.monitor()
+    asyncio.run(monitor.monitor())
 
 if __name__ == '__main__':
     main() 
\ No newline at end of file
@@ -3,13 +3,26 @@
 import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
-from datetime import datetime, timedelta
+from datetime import datetime
+
+def accumulate_with_resets(increments, reset_mask):
+    """Running total of increments that restarts from zero wherever reset_mask is set."""
+    increments = increments.astype(np.int64)
+    increments[:1] = 0  # Counters start at zero (a slice, so empty input is fine)
+    increments[reset_mask] = 0
+    totals = np.cumsum(increments)
+    
+    # Subtract the total reached at the most recent reset from every sample after it
+    segment = np.cumsum(reset_mask)
+    segment_start = np.concatenate(([0], totals[reset_mask]))
+    return totals - segment_start[segment]
 
 def generate_synthetic_data(duration_seconds=60, sample_rate_hz=10):
     """Generate synthetic network latency data."""
     # Generate timestamps
     num_samples = duration_seconds * sample_rate_hz
-    timestamps = [datetime.now() + timedelta(seconds=i/sample_rate_hz) for i in range(num_samples)]
+    step = np.timedelta64(int(1e9 / sample_rate_hz), 'ns')
+    timestamps = np.datetime64(datetime.now(), 'ns') + np.arange(num_samples, dtype='i8') * step
     
     # Generate base RTT with some natural variation (normal distribution)
     base_rtt = np.random.normal(10, 2, num_samples)  # Mean 10ms, std 2ms
@@ -22,18 +35,11 @@ def generate_synthetic_data(duration_seconds=60, sample_rate_hz=10):
     base_rtt = np.maximum(base_rtt, 0.1)
     
     # Generate interface statistics with gradual increases and occasional resets
-    drops = np.zeros(num_samples)
-    errors = np.zeros(num_samples)
-    
-    # Simulate accumulating drops and errors
-    for i in range(1, num_samples):
-        drops[i] = drops[i-1] + np.random.poisson(0.1)  # Average 0.1 new drops per sample
-        errors[i] = errors[i-1] + np.random.poisson(0.05)  # Average 0.05 new errors per sample
-        
-        # Occasional resets (simulating interface resets or counter rollovers)
-        if np.random.random() < 0.01:  # 1% chance of reset
-            drops[i] = 0
-            errors[i] = 0
+    # (simulating interface resets or counter rollovers, 1% chance per sample)
+    reset_mask = np.random.random(num_samples) < 0.01
+    reset_mask[:1] = False
+    drops = accumulate_with_resets(np.random.poisson(0.1, num_samples), reset_mask)  # Average 0.1 new drops per sample
+    errors = accumulate_with_resets(np.random.poisson(0.05, num_samples), reset_mask)  # Average 0.05 new errors per sample
     
     # Create DataFrame
     df = pd.DataFrame({
@@ -41,7 +47,8 @@ def generate_synthetic_data(duration_seconds=60, sample_rate_hz=10):
         'rtt': base_rtt,
         'interface_drops': drops,
         'interface_errors': errors,
-        'status': ['success' if r > 0 else 'failed' for r in base_rtt]
+        'status': pd.Categorical.from_codes((base_rtt <= 0).astype(np.int8),
+                                            categories=['success', 'failed'])
     })
     
     return df
@@ -97,9 +104,10 @@ def main():
     print("Generating synthetic network data...")
     df = generate_synthetic_data(duration_seconds=60, sample_rate_hz=10)
     
-    # Save to CSV
-    df.to_csv('logs/hft_latency.log', index=False)
-    print("Data saved to logs/hft_latency.log")
+    # Save as Parquet with the same column types the visualizer loads
+    df.astype({'rtt': np.float32}) \
+        .to_parquet('logs/hft_latency.parquet', index=False, compression='zstd', use_dictionary=True)
+    print("Data saved to logs/hft_latency.parquet")
     
     # Plot the data
     print("Plotting network statistics...")
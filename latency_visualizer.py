@@ -1,249 +1,474 @@
 #!/usr/bin/env python3
 
+import io
+import os
 import sys
+import mmap
 import pandas as pd
 import matplotlib.pyplot as plt
 from matplotlib.animation import FuncAnimation
 from datetime import datetime, timedelta
 import numpy as np
-from PyQt5.QtWidgets import (QApplication, QMainWindow, QVBoxLayout, QWidget, 
+import pyarrow as pa
+from pyarrow import csv as pa_csv
+from pyarrow import compute as pc
+from pyarrow import parquet as pq
+from PyQt5.QtCore import QObject, QTimer, pyqtSignal
+from PyQt5.QtWidgets import (QApplication, QMainWindow, QVBoxLayout, QHBoxLayout, QWidget, 
                            QLabel, QDesktopWidget)
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 import warnings
 
 warnings.filterwarnings('ignore')
 
-class BaseMonitorWindow(QMainWindow):
-    def __init__(self, title, x_offset=0, y_offset=0):
+# Parse the log straight into typed columns so no pandas coercion is needed.
+# A float32 RTT halves the bytes moved per frame without losing precision,
+# and reductions cast up to float64 where it matters. The interface
+# counters are parsed as float64, because older generator output writes
+# them as "7.0", and integer_counters() then narrows them to int64.
+# They are int64 rather than int32 because netstat totals on a
+# long-running host can pass 2^31.
+# Status is dictionary-encoded into a Categorical so filters compare codes.
+# The timestamp type depends on which tool wrote the log, so it is inferred
+# and then normalised by normalize_timestamps().
+LOG_CONVERT_OPTIONS = pa_csv.ConvertOptions(column_types={
+    'rtt': pa.float32(),
+    'interface_drops': pa.float64(),
+    'interface_errors': pa.float64(),
+    'status': pa.dictionary(pa.int32(), pa.string()),
+})
+# Skip rows with the wrong number of fields, such as a line cut short when
+# the writer crashed, rather than failing the whole read
+LOG_PARSE_OPTIONS = pa_csv.ParseOptions(delimiter=',',
+                                        invalid_row_handler=lambda row: 'skip')
+
+def normalize_timestamps(table):
+    """Cast the timestamp column to timestamp[us] whatever wrote the log.
+
+    network_monitor.sh logs epoch seconds ("1717800000.123456789"), which
+    arrow parses as numbers. data_generator.py and the sample logs use ISO
+    datetimes ("2025-06-07 23:51:04.322358"), which arrow infers as
+    timestamps, or as strings when a chunk holds an unusual format.
+    """
+    index = table.schema.get_field_index('timestamp')
+    if index < 0:
+        return table
+
+    column = table.column(index)
+    if pa.types.is_integer(column.type) or pa.types.is_floating(column.type):
+        micros = pc.round(pc.multiply(column.cast(pa.float64()), 1e6))
+        column = micros.cast(pa.int64()).cast(pa.timestamp('us'))
+    else:
+        column = pc.cast(column, pa.timestamp('us'), safe=False)
+    return table.set_column(index, 'timestamp', column)
+
+def integer_counters(table):
+    """Cast the interface counters to int64, refusing any that are not whole.
+
+    float64 holds every count below 2^53 exactly, so the cast loses
+    nothing. Arrow's safe cast raises ArrowInvalid for a fractional count
+    instead of truncating it.
+    """
+    for name in ('interface_drops', 'interface_errors'):
+        index = table.schema.get_field_index(name)
+        if index >= 0:
+            table = table.set_column(index, name, table.column(index).cast(pa.int64()))
+    return table
+
+def mask_failed_rtt(table):
+    """Null the RTT of failed pings, which network_monitor.sh logs as 999999."""
+    rtt_index = table.schema.get_field_index('rtt')
+    if rtt_index < 0 or table.schema.get_field_index('status') < 0:
+        return table
+
+    rtt = table.column(rtt_index)
+    failed = pc.fill_null(pc.equal(table.column('status'), 'failed'), False)
+    return table.set_column(rtt_index, 'rtt',
+                            pc.if_else(failed, pa.scalar(None, rtt.type), rtt))
+
+def read_log(log_file):
+    # Parquet logs (from data_generator.py) are already typed; the live
+    # monitor appends CSV, which Parquet cannot support
+    if log_file.endswith('.parquet'):
+        table = pq.read_table(log_file)
+    else:
+        table = pa_csv.read_csv(log_file, parse_options=LOG_PARSE_OPTIONS,
+                                convert_options=LOG_CONVERT_OPTIONS)
+    table = mask_failed_rtt(integer_counters(normalize_timestamps(table)))
+    return table.to_pandas(split_blocks=True, self_destruct=True)
+
+def rolling_mean(values, window):
+    """Trailing mean over up to `window` samples, skipping NaN.
+
+    Equivalent to Series.rolling(window, min_periods=1).mean(), computed
+    from differences of cumulative sums in a single O(N) pass.
+    """
+    valid = ~np.isnan(values)
+    sums = np.concatenate(([0.0], np.cumsum(np.where(valid, values, 0.0))))
+    counts = np.concatenate(([0], np.cumsum(valid)))
+
+    end = np.arange(1, len(values) + 1)
+    start = np.maximum(end - window, 0)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return (sums[end] - sums[start]) / (counts[end] - counts[start])
+
+def percentile_99(values):
+    """Nearest-rank 99th percentile via np.partition, O(N) instead of a full sort"""
+    k = max(0, int(np.ceil(0.99 * values.size)) - 1)
+    return np.partition(values, k)[k]
+
+class DataSource(QObject):
+    """Loads the log once per tick and hands the frame to every window"""
+    updated = pyqtSignal(object)
+
+    def __init__(self, log_file="logs/hft_latency.log", update_interval=50):
         super().__init__()
-        self.setWindowTitle(title)
-        self.setGeometry(100 + x_offset, 100 + y_offset, 800, 400)
-
-        main_widget = QWidget()
-        self.setCentralWidget(main_widget)
-        self.layout = QVBoxLayout(main_widget)
-
-        self.fig, self.ax = plt.subplots(figsize=(8, 4))
-        self.canvas = FigureCanvas(self.fig)
-        self.layout.addWidget(self.canvas)
-
-        self.log_file = "logs/hft_latency.log"
-        self.window_size = timedelta(seconds=10)
-        self.update_interval = 50
-        self.microburst_threshold = 0.5
+        self.log_file = log_file
+        self.df = pd.DataFrame()
+        self._file_state = None  # (mtime, size) of the log when self.df was parsed
+
+        # Incremental CSV state: rows parsed so far and where the next line starts
+        self._offset = 0
+        self._read_options = None  # column names from the log header
+        self._convert_options = LOG_CONVERT_OPTIONS
+        self._table = None
+
+        self.timer = QTimer(self)
+        self.timer.timeout.connect(self.refresh)
+        self.timer.start(update_interval)
+
+    def parse_chunk(self, data):
+        """Parse complete CSV lines into a table matching the rows already read"""
+        chunk = pa_csv.read_csv(io.BytesIO(data), read_options=self._read_options,
+                                parse_options=LOG_PARSE_OPTIONS,
+                                convert_options=self._convert_options)
+        if self._convert_options is LOG_CONVERT_OPTIONS:
+            # Pin inferred column types so later chunks concatenate cleanly.
+            # Widen the timestamp so later rows with fractional seconds
+            # still parse if the first chunk happened to have none.
+            column_types = {field.name: field.type for field in chunk.schema}
+            timestamp_type = column_types.get('timestamp')
+            if timestamp_type is not None:
+                if pa.types.is_integer(timestamp_type) or pa.types.is_floating(timestamp_type):
+                    column_types['timestamp'] = pa.float64()
+                elif pa.types.is_timestamp(timestamp_type):
+                    column_types['timestamp'] = pa.timestamp('ns')
+            self._convert_options = pa_csv.ConvertOptions(column_types=column_types)
+        return mask_failed_rtt(integer_counters(normalize_timestamps(chunk)))
+
+    def read_appended(self, size):
+        """Parse only the CSV lines appended since the last read"""
+        if size < self._offset:
+            # Log was truncated or recreated, start over
+            self._offset = 0
+            self._read_options = None
+            self._convert_options = LOG_CONVERT_OPTIONS
+            self._table = None
+
+        tail = b''
+        end = self._offset
+        if size > self._offset:
+            with open(self.log_file, 'rb') as f, \
+                    mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if self._read_options is None:
+                    header_end = mm.find(b'\n')
+                    if header_end < 0:
+                        return pd.DataFrame()
+                    column_names = mm[:header_end].decode().strip().split(',')
+                    self._read_options = pa_csv.ReadOptions(column_names=column_names)
+                    self._offset = header_end + 1
+
+                # Leave a partially written trailing line for the next read
+                end = mm.rfind(b'\n', self._offset) + 1
+                if end > self._offset:
+                    tail = mm[self._offset:end]
+
+        if tail:
+            try:
+                chunks = [self.parse_chunk(tail)]
+            except pa.ArrowInvalid:
+                # One bad value (e.g. "2.5" drops) fails the whole block, so
+                # parse line by line and skip only the lines that still fail
+                chunks = []
+                for line in tail.splitlines(keepends=True):
+                    try:
+                        chunks.append(self.parse_chunk(line))
+                    except pa.ArrowInvalid as e:
+                        print(f"Skipping bad log line {line!r}: {e}")
+
+            # Complete lines are never retried, or one bad line would stall
+            # the reader; only the partial trailing line waits for more data
+            self._offset = end
+            if chunks:
+                if self._table is not None:
+                    chunks.insert(0, self._table)
+                self._table = pa.concat_tables(chunks)
+                if self._table.column(0).num_chunks > 64:
+                    self._table = self._table.combine_chunks()
+
+        if self._table is None:
+            return pd.DataFrame()
+        # Parsing is per chunk, but this conversion still copies every row
+        # read so far. It stays O(N) on purpose: the stats panel summarises
+        # the whole log, not just the plotted window.
+        return self._table.to_pandas(split_blocks=True)
 
     def load_data(self):
         try:
-            df = pd.read_csv(self.log_file)
+            # The log changes at the ping rate, slower than we poll it
+            st = os.stat(self.log_file)
+            file_state = (st.st_mtime_ns, st.st_size)
+            if file_state == self._file_state:
+                return self.df
+            
+            if self.log_file.endswith('.parquet'):
+                df = read_log(self.log_file)
+            else:
+                df = self.read_appended(st.st_size)
+            self._file_state = file_state
             if df.empty:
                 return pd.DataFrame()
             
-            df['timestamp'] = pd.to_datetime(df['timestamp'])
-            df.loc[df['status'] == 'failed', 'rtt'] = np.nan
-            df['rtt'] = pd.to_numeric(df['rtt'], errors='coerce')
-            df['interface_drops'] = pd.to_numeric(df['interface_drops'], errors='coerce')
-            df['interface_errors'] = pd.to_numeric(df['interface_errors'], errors='coerce')
-            
+            # Failed RTTs were already nulled in arrow as each chunk was read
             return df
         except Exception as e:
             print(f"Error loading data: {e}")
             return pd.DataFrame()
 
-class LatencyMonitor(BaseMonitorWindow):
-    def __init__(self):
-        super().__init__('Network Latency Monitor', x_offset=0)
-        self.ax.set_title('Network Latency (ms)')
-        self.ax.set_ylabel('RTT (ms)')
-        self.ax.grid(True, alpha=0.3)
-        self.anim = FuncAnimation(self.fig, self.update_plot, interval=self.update_interval)
-
-    def update_plot(self, frame):
+    def refresh(self):
         df = self.load_data()
-        if df.empty:
-            return
-
-        current_time = df['timestamp'].max()
-        if pd.isnull(current_time):
-            return
-            
-        start_time = current_time - self.window_size
-        mask = (df['timestamp'] >= start_time) & (df['timestamp'] <= current_time)
-        df_window = df.loc[mask].copy()
-
-        if df_window.empty:
+        if df is self.df:
             return
-
-        self.ax.clear()
-        valid_data = df_window[df_window['rtt'].notna()]
         
-        if not valid_data.empty:
-            self.ax.plot(valid_data['timestamp'], valid_data['rtt'], 
-                        label='Latency', color='blue', linewidth=1)
-            percentile_99 = valid_data['rtt'].quantile(0.99)
-            self.ax.axhline(y=percentile_99, color='r', linestyle='--', 
-                          label=f'99th Percentile ({percentile_99:.2f}ms)')
-
-        self.ax.set_title('Network Latency (ms)')
-        self.ax.set_ylabel('RTT (ms)')
-        self.ax.grid(True, alpha=0.3)
-        self.ax.legend(loc='upper right')
-        self.ax.set_ylim(bottom=0)
-        self.ax.tick_params(axis='x', rotation=45)
-        self.fig.tight_layout()
-
-class InterfaceStatsMonitor(BaseMonitorWindow):
-    def __init__(self):
-        super().__init__('Interface Statistics Monitor', x_offset=850)
-        self.ax.set_title('Interface Statistics')
-        self.ax.set_ylabel('Count')
+        self.df = df
+        self.updated.emit(self.df)
+
+class MonitorPlot:
+    """One live plot on the dashboard, drawn with blitting"""
+    def __init__(self, ax, title, ylabel, window_size, ylim):
+        self.ax = ax
+        self.ax.set_title(title)
+        self.ax.set_ylabel(ylabel)
+        self.ax.set_ylim(*ylim)
+
+        # Time runs relative to the latest sample so the x axis never moves
+        # and blitting only has to redraw the data artists
+        self.ax.set_xlim(-window_size.total_seconds(), 0)
+        self.ax.set_xlabel('Time (s)')
         self.ax.grid(True, alpha=0.3)
-        self.anim = FuncAnimation(self.fig, self.update_plot, interval=self.update_interval)
 
-    def update_plot(self, frame):
-        df = self.load_data()
-        if df.empty:
-            return
-
-        current_time = df['timestamp'].max()
-        if pd.isnull(current_time):
-            return
-            
-        start_time = current_time - self.window_size
-        mask = (df['timestamp'] >= start_time) & (df['timestamp'] <= current_time)
-        df_window = df.loc[mask].copy()
-
-        if df_window.empty:
-            return
+    def fit_ylim(self, low, high):
+        # Changing the limits invalidates the blit background, so only rescale
+        # when the data leaves the axis or shrinks to under half of it.
+        # Returns True when the caller needs to redraw the figure.
+        if not (np.isfinite(low) and np.isfinite(high)):
+            return False
+
+        pad = (high - low) * 0.1 or 1.0
+        target_bottom = max(low - pad, 0) if low >= 0 else low - pad
+        target_top = high + pad
+
+        # Compare against the padded target, not the raw data range, so flat
+        # data (high == low) settles instead of rescaling every frame
+        bottom, top = self.ax.get_ylim()
+        if low >= bottom and high <= top and (top - bottom) <= 2 * (target_top - target_bottom):
+            return False
+
+        self.ax.set_ylim(target_bottom, target_top)
+        return True
+
+class LatencyPlot(MonitorPlot):
+    def __init__(self, ax, window_size):
+        super().__init__(ax, 'Network Latency (ms)', 'RTT (ms)', window_size, (0, 1))
+
+        self.line, = self.ax.plot([], [], label='Latency', color='blue', linewidth=1)
+        self.hline = self.ax.axhline(y=0, color='r', linestyle='--',
+                                     label='99th Percentile')
+        self.legend = self.ax.legend(loc='upper right')
+        self.artists = (self.line, self.hline, self.legend)
+
+    def update_plot(self, df_window, seconds):
+        valid = df_window['rtt'].notna().to_numpy()
+        if not valid.any():
+            self.line.set_data([], [])
+            self.hline.set_visible(False)
+            return False
+
+        rtt = df_window['rtt'].to_numpy()[valid]
+        self.line.set_data(seconds[valid], rtt)
+        p99 = percentile_99(rtt)
+        self.hline.set_ydata([p99, p99])
+        self.hline.set_visible(True)
+        self.legend.get_texts()[1].set_text(f'99th Percentile ({p99:.2f}ms)')
+        return self.fit_ylim(0, rtt.max())
+
+class InterfaceStatsPlot(MonitorPlot):
+    def __init__(self, ax, window_size):
+        super().__init__(ax, 'Interface Statistics', 'Count', window_size, (0, 1))
+
+        self.drops_line, = self.ax.plot([], [], label='Drops', color='red', linewidth=1)
+        self.errors_line, = self.ax.plot([], [], label='Errors', color='orange', linewidth=1)
+        self.ax.legend(loc='upper right')
+        self.artists = (self.drops_line, self.errors_line)
 
-        self.ax.clear()
-        df_window['drops_smooth'] = df_window['interface_drops'].rolling(window=5, min_periods=1).mean()
-        df_window['errors_smooth'] = df_window['interface_errors'].rolling(window=5, min_periods=1).mean()
+    def update_plot(self, df_window, seconds):
+        drops_smooth = rolling_mean(df_window['interface_drops'].to_numpy(dtype=np.float64), 5)
+        errors_smooth = rolling_mean(df_window['interface_errors'].to_numpy(dtype=np.float64), 5)
         
-        self.ax.plot(df_window['timestamp'], df_window['drops_smooth'],
-                    label='Drops', color='red', linewidth=1)
-        self.ax.plot(df_window['timestamp'], df_window['errors_smooth'],
-                    label='Errors', color='orange', linewidth=1)
-
-        self.ax.set_title('Interface Statistics')
-        self.ax.set_ylabel('Count')
-        self.ax.grid(True, alpha=0.3)
+        self.drops_line.set_data(seconds, drops_smooth)
+        self.errors_line.set_data(seconds, errors_smooth)
+        return self.fit_ylim(min(np.nanmin(drops_smooth), np.nanmin(errors_smooth)),
+                             max(np.nanmax(drops_smooth), np.nanmax(errors_smooth)))
+
+class MicroburstPlot(MonitorPlot):
+    def __init__(self, ax, window_size, microburst_threshold=0.5):
+        super().__init__(ax, 'Microburst Detection', 'RTT Variation (ms)', window_size, (-5, 5))
+        self.microburst_threshold = microburst_threshold
+
+        self.line, = self.ax.plot([], [], label='RTT Variation', color='green', linewidth=1)
+        self.scatter = self.ax.scatter([], [], color='red', label='Microbursts', zorder=5)
         self.ax.legend(loc='upper right')
-        self.ax.tick_params(axis='x', rotation=45)
-        self.fig.tight_layout()
+        self.artists = (self.line, self.scatter)
+
+    def detect_microbursts(self, timestamps, rtt_diff):
+        if rtt_diff.size == 0:
+            return timestamps, rtt_diff
+
+        magnitude = np.abs(rtt_diff)
+        # Jumps over 100ms are outages/recoveries rather than microbursts
+        mask = np.greater(magnitude, self.microburst_threshold)
+        np.logical_and(mask, magnitude <= 100, out=mask)
+        idx = np.flatnonzero(mask)
+        return timestamps[idx], rtt_diff[idx]
+
+    def update_plot(self, df_window, seconds):
+        rtt = df_window['rtt'].to_numpy()
+        rtt_diff = np.empty_like(rtt)
+        rtt_diff[0] = np.nan
+        np.subtract(rtt[1:], rtt[:-1], out=rtt_diff[1:])
+
+        valid = ~np.isnan(rtt_diff)
+        valid_seconds = seconds[valid]
+        valid_diff = rtt_diff[valid]
+        
+        self.line.set_data(valid_seconds, valid_diff)
+        burst_seconds, burst_diff = self.detect_microbursts(valid_seconds, valid_diff)
+        self.scatter.set_offsets(np.column_stack((burst_seconds, burst_diff)))
+        return False
+
+class Dashboard(QMainWindow):
+    LABEL_FORMATS = (
+        "Average Latency: {avg_latency:.2f} ms",
+        "Min/Max Latency: {min_latency:.2f}/{max_latency:.2f} ms",
+        "Jitter: {jitter:.2f} ms",
+        "Packet Loss: {packet_loss:.1f}%",
+        "Interface Drops/Errors: {interface_drops}/{interface_errors}",
+    )
+
+    def __init__(self, source):
+        super().__init__()
+        self.setWindowTitle('Network Latency Monitor')
+        self.setGeometry(100, 100, 1300, 900)
 
-class MicroburstMonitor(BaseMonitorWindow):
-    def __init__(self):
-        super().__init__('Microburst Detection Monitor', y_offset=450)
-        self.ax.set_title('Microburst Detection')
-        self.ax.set_ylabel('RTT Variation (ms)')
-        self.ax.grid(True, alpha=0.3)
-        self.anim = FuncAnimation(self.fig, self.update_plot, interval=self.update_interval)
+        main_widget = QWidget()
+        self.setCentralWidget(main_widget)
+        layout = QHBoxLayout(main_widget)
 
-    def detect_microbursts(self, df):
-        if df.empty:
-            return pd.DataFrame()
-        
-        df['rtt_diff'] = df['rtt'].diff()
-        df.loc[df['rtt_diff'].abs() > 100, 'rtt_diff'] = np.nan
-        microbursts = df[abs(df['rtt_diff']) > self.microburst_threshold].copy()
-        return microbursts
+        self.window_size = timedelta(seconds=10)
+        self.update_interval = 50
 
-    def update_plot(self, frame):
-        df = self.load_data()
-        if df.empty:
-            return
+        # All plots share one figure so each frame is a single draw
+        self.fig, (ax1, ax2, ax3) = plt.subplots(3, 1, figsize=(10, 9))
+        self.canvas = FigureCanvas(self.fig)
+        layout.addWidget(self.canvas, stretch=1)
 
-        current_time = df['timestamp'].max()
-        if pd.isnull(current_time):
-            return
-            
-        start_time = current_time - self.window_size
-        mask = (df['timestamp'] >= start_time) & (df['timestamp'] <= current_time)
-        df_window = df.loc[mask].copy()
+        self.plots = (
+            LatencyPlot(ax1, self.window_size),
+            InterfaceStatsPlot(ax2, self.window_size),
+            MicroburstPlot(ax3, self.window_size),
+        )
+        self.artists = tuple(artist for plot in self.plots for artist in plot.artists)
 
-        if df_window.empty:
-            return
+        stats_layout = QVBoxLayout()
+        layout.addLayout(stats_layout)
+        self.stats_labels = []
+        for _ in self.LABEL_FORMATS:
+            label = QLabel()
+            label.setStyleSheet("QLabel { font-size: 14pt; padding: 5px; }")
+            stats_layout.addWidget(label)
+            self.stats_labels.append(label)
+        stats_layout.addStretch()
 
-        self.ax.clear()
-        df_window['rtt_diff'] = df_window['rtt'].diff()
-        valid_diff = df_window[df_window['rtt_diff'].notna()]
-        
-        if not valid_diff.empty:
-            self.ax.plot(valid_diff['timestamp'], valid_diff['rtt_diff'],
-                        label='RTT Variation', color='green', linewidth=1)
-            
-            microbursts = self.detect_microbursts(valid_diff)
-            if not microbursts.empty:
-                self.ax.scatter(microbursts['timestamp'], microbursts['rtt_diff'],
-                              color='red', label='Microbursts', zorder=5)
+        # The frame is shared through the data source, so never modify it in place
+        self.df = source.df
+        source.updated.connect(self.on_data)
 
-        self.ax.set_title('Microburst Detection')
-        self.ax.set_ylabel('RTT Variation (ms)')
-        self.ax.grid(True, alpha=0.3)
-        self.ax.legend(loc='upper right')
-        self.ax.set_ylim(-5, 5)
-        self.ax.tick_params(axis='x', rotation=45)
         self.fig.tight_layout()
+        self.anim = FuncAnimation(self.fig, self.update_plot, interval=self.update_interval,
+                                  blit=True, cache_frame_data=False)
 
-class StatsDashboard(QMainWindow):
-    def __init__(self):
-        super().__init__()
-        self.setWindowTitle('Network Statistics Dashboard')
-        self.setGeometry(850, 450, 800, 200)
+    def get_window(self, df):
+        # The log is append-only, so timestamps are sorted and the window
+        # start can be found by binary search instead of a full-column mask
+        timestamps = df['timestamp'].to_numpy()
+        current_time = timestamps[-1]
+        if np.isnat(current_time):
+            return df.iloc[:0]
 
-        main_widget = QWidget()
-        self.setCentralWidget(main_widget)
-        layout = QVBoxLayout(main_widget)
+        start_time = current_time - np.timedelta64(self.window_size)
+        start = np.searchsorted(timestamps, start_time, side='left')
+        return df.iloc[start:]
 
-        self.stats_labels = []
-        for _ in range(5):
-            label = QLabel()
-            label.setStyleSheet("QLabel { font-size: 14pt; padding: 5px; }")
-            layout.addWidget(label)
-            self.stats_labels.append(label)
+    def update_plot(self, frame):
+        df = self.df
+        if df.empty:
+            return self.artists
 
-        self.log_file = "logs/hft_latency.log"
-        self.window_size = timedelta(seconds=10)
-        self.update_interval = 50
-        self.microburst_threshold = 0.5
+        df_window = self.get_window(df)
+        if df_window.empty:
+            return self.artists
 
-        # Start update timer
-        self.timer = self.startTimer(self.update_interval)
+        timestamps = df_window['timestamp'].to_numpy()
+        seconds = (timestamps - timestamps[-1]) / np.timedelta64(1, 's')
 
-    def load_data(self):
-        try:
-            return pd.read_csv(self.log_file)
-        except Exception:
-            return pd.DataFrame()
+        rescaled = False
+        for plot in self.plots:
+            rescaled |= plot.update_plot(df_window, seconds)
+        if rescaled:
+            # New limits need a fresh background before blitting
+            self.canvas.draw()
+        return self.artists
 
     def calculate_stats(self, df):
         if df.empty:
             return {}
 
-        valid_pings = df[
-            (df['status'] == 'success') & 
-            (df['rtt'].notna()) &
-            (df['rtt'] < 1000) & 
-            (df['rtt'] > 0)
-        ]
+        # NaN RTTs fail both comparisons, so missing values drop out here too
+        rtt = df['rtt'].to_numpy()
+        mask = (df['status'] == 'success').to_numpy() & (rtt < 1000) & (rtt > 0)
 
-        if valid_pings.empty:
+        # Accumulate in float64; the column itself is stored as float32
+        valid_rtt = rtt[mask].astype(np.float64)
+        n = valid_rtt.size
+        if n == 0:
             return {}
 
+        avg = valid_rtt.sum() / n
+        variance = (np.dot(valid_rtt, valid_rtt) - n * avg * avg) / (n - 1) if n > 1 else np.nan
         stats = {
-            'avg_latency': valid_pings['rtt'].mean(),
-            'min_latency': valid_pings['rtt'].min(),
-            'max_latency': valid_pings['rtt'].max(),
-            'jitter': valid_pings['rtt'].std(),
-            'packet_loss': (1 - len(valid_pings) / len(df)) * 100,
-            '99th_percentile': valid_pings['rtt'].quantile(0.99),
-            'interface_drops': df['interface_drops'].iloc[-1],
-            'interface_errors': df['interface_errors'].iloc[-1]
+            'avg_latency': avg,
+            'min_latency': valid_rtt.min(),
+            'max_latency': valid_rtt.max(),
+            'jitter': np.sqrt(max(variance, 0.0)),
+            'packet_loss': (1 - n / len(df)) * 100,
+            '99th_percentile': percentile_99(valid_rtt),
+            'interface_drops': df['interface_drops'].to_numpy()[-1],
+            'interface_errors': df['interface_errors'].to_numpy()[-1]
         }
         return stats
 
-    def timerEvent(self, event):
-        df = self.load_data()
+    def on_data(self, df):
+        self.df = df
         if df.empty:
             return
 
@@ -251,28 +476,20 @@ class StatsDashboard(QMainWindow):
         if not stats:
             return
 
-        self.stats_labels[0].setText(f"Average Latency: {stats['avg_latency']:.2f} ms")
-        self.stats_labels[1].setText(f"Min/Max Latency: {stats['min_latency']:.2f}/{stats['max_latency']:.2f} ms")
-        self.stats_labels[2].setText(f"Jitter: {stats['jitter']:.2f} ms")
-        self.stats_labels[3].setText(f"Packet Loss: {stats['packet_loss']:.1f}%")
-        self.stats_labels[4].setText(f"Interface Drops/Errors: {stats['interface_drops']}/{stats['interface_errors']}")
+        for label, fmt in zip(self.stats_labels, self.LABEL_FORMATS):
+            label.setText(fmt.format(**stats))
 
 def main():
     app = QApplication(sys.argv)
     
-    # Create all monitor windows
-    latency_monitor = LatencyMonitor()
-    interface_monitor = InterfaceStatsMonitor()
-    microburst_monitor = MicroburstMonitor()
-    stats_dashboard = StatsDashboard()
+    # One data source parses the log for the dashboard
+    log_file = sys.argv[1] if len(sys.argv) > 1 else "logs/hft_latency.log"
+    source = DataSource(log_file)
     
-    # Show all windows
-    latency_monitor.show()
-    interface_monitor.show()
-    microburst_monitor.show()
-    stats_dashboard.show()
+    dashboard = Dashboard(source)
+    dashboard.show()
     
     sys.exit(app.exec_())
 
 if __name__ == '__main__':
-    main() 
\ No newline at end of file
+    main()
\ No newline at end of file